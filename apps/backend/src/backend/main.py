@@ -4,7 +4,7 @@ from contextlib import asynccontextmanager
 from pathlib import Path
 
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import Depends, FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -74,6 +74,11 @@ memory_manager = MemoryManager(_DB_PATH)
 service = MindService(store=mind_store, memory=memory_manager)
 
 
+def get_service() -> MindService:
+    """Request dependency for the Mind service; tests override it per app."""
+    return service
+
+
 def _migrate_legacy_json(base_dir: Path) -> None:
     """One-time migration: import legacy JSON files into SQLite if they exist."""
     minds_dir = base_dir / "minds"
@@ -185,7 +190,9 @@ def health():
 
 
 @app.post("/api/minds")
-def create_mind(request: MindCreateRequest):
+def create_mind(
+    request: MindCreateRequest, service: MindService = Depends(get_service)
+):
     mind = service.create_mind(
         name=request.name,
         personality=request.personality,
@@ -197,12 +204,12 @@ def create_mind(request: MindCreateRequest):
 
 
 @app.get("/api/minds")
-def list_minds():
+def list_minds(service: MindService = Depends(get_service)):
     return [mind.model_dump(mode="json") for mind in service.list_minds()]
 
 
 @app.get("/api/minds/{mind_id}")
-def get_mind(mind_id: str):
+def get_mind(mind_id: str, service: MindService = Depends(get_service)):
     try:
         return service.get_mind(mind_id).model_dump(mode="json")
     except MindNotFoundError:
@@ -210,7 +217,11 @@ def get_mind(mind_id: str):
 
 
 @app.patch("/api/minds/{mind_id}")
-def update_mind(mind_id: str, request: MindUpdateRequest):
+def update_mind(
+    mind_id: str,
+    request: MindUpdateRequest,
+    service: MindService = Depends(get_service),
+):
     try:
         mind = service.update_mind(
             mind_id,
@@ -226,7 +237,11 @@ def update_mind(mind_id: str, request: MindUpdateRequest):
 
 
 @app.post("/api/minds/{mind_id}/feedback")
-def add_mind_feedback(mind_id: str, request: MindFeedbackRequest):
+def add_mind_feedback(
+    mind_id: str,
+    request: MindFeedbackRequest,
+    service: MindService = Depends(get_service),
+):
     try:
         memory = service.submit_feedback(
             mind_id=mind_id,
@@ -245,7 +260,11 @@ def add_mind_feedback(mind_id: str, request: MindFeedbackRequest):
 
 
 @app.post("/api/minds/{mind_id}/delegate")
-async def delegate_task(mind_id: str, request: DelegateTaskRequest):
+async def delegate_task(
+    mind_id: str,
+    request: DelegateTaskRequest,
+    service: MindService = Depends(get_service),
+):
     async def event_stream():
         async for event in service.delegate(
             mind_id=mind_id,
@@ -265,7 +284,7 @@ async def delegate_task(mind_id: str, request: DelegateTaskRequest):
 
 
 @app.get("/api/minds/{mind_id}/tasks")
-def list_mind_tasks(mind_id: str):
+def list_mind_tasks(mind_id: str, service: MindService = Depends(get_service)):
     try:
         return [task.model_dump(mode="json") for task in service.list_tasks(mind_id)]
     except MindNotFoundError:
@@ -273,7 +292,9 @@ def list_mind_tasks(mind_id: str):
 
 
 @app.get("/api/minds/{mind_id}/tasks/{task_id}")
-def get_mind_task(mind_id: str, task_id: str):
+def get_mind_task(
+    mind_id: str, task_id: str, service: MindService = Depends(get_service)
+):
     try:
         return service.get_task(mind_id, task_id).model_dump(mode="json")
     except TaskNotFoundError:
@@ -281,7 +302,9 @@ def get_mind_task(mind_id: str, task_id: str):
 
 
 @app.get("/api/minds/{mind_id}/tasks/{task_id}/drones")
-def list_task_drones(mind_id: str, task_id: str):
+def list_task_drones(
+    mind_id: str, task_id: str, service: MindService = Depends(get_service)
+):
     try:
         return [
             drone.model_dump(mode="json")
@@ -292,7 +315,9 @@ def list_task_drones(mind_id: str, task_id: str):
 
 
 @app.get("/api/minds/{mind_id}/drones/{drone_id}/trace")
-def get_drone_trace(mind_id: str, drone_id: str):
+def get_drone_trace(
+    mind_id: str, drone_id: str, service: MindService = Depends(get_service)
+):
     try:
         return service.get_drone_trace(mind_id, drone_id)
     except TaskNotFoundError:
@@ -300,7 +325,9 @@ def get_drone_trace(mind_id: str, drone_id: str):
 
 
 @app.get("/api/minds/{mind_id}/tasks/{task_id}/trace")
-def get_mind_task_trace(mind_id: str, task_id: str):
+def get_mind_task_trace(
+    mind_id: str, task_id: str, service: MindService = Depends(get_service)
+):
     try:
         return service.get_task_trace(mind_id, task_id)
     except TaskNotFoundError:
@@ -308,7 +335,11 @@ def get_mind_task_trace(mind_id: str, task_id: str):
 
 
 @app.get("/api/minds/{mind_id}/memory")
-def list_mind_memory(mind_id: str, category: str | None = None):
+def list_mind_memory(
+    mind_id: str,
+    category: str | None = None,
+    service: MindService = Depends(get_service),
+):
     try:
         return [
             m.model_dump(mode="json")
@@ -97,14 +97,28 @@ END;
 """
 
 
-def init_db(db_path: Path) -> sqlite3.Connection:
+def init_db(db_path: Path | str) -> sqlite3.Connection:
     """Initialize a SQLite database with WAL mode and create schema.
 
+    ``db_path`` may also be ``":memory:"`` or a SQLite URI such as
+    ``file:name?mode=memory&cache=shared``; in-memory databases skip WAL mode,
+    which SQLite does not support for them. Shared-cache URIs are for tests
+    only: connections on one URI (e.g. a MindStore and MemoryManager pair)
+    use table-level locks that ignore ``busy_timeout``, so concurrent writes
+    from different threads fail with "database table is locked".
+
     Safe to call multiple times — all schema objects use IF NOT EXISTS.
     """
-    db_path.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(str(db_path), check_same_thread=False)
-    conn.execute("PRAGMA journal_mode=WAL")
+    if db_path == ":memory:":
+        conn = sqlite3.connect(db_path, check_same_thread=False)
+    elif isinstance(db_path, str) and db_path.startswith("file:"):
+        conn = sqlite3.connect(db_path, uri=True, check_same_thread=False)
+    else:
+        db_path = Path(db_path)
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(db_path), check_same_thread=False)
+    if not _is_memory_db(db_path):
+        conn.execute("PRAGMA journal_mode=WAL")
     conn.execute("PRAGMA foreign_keys=ON")
     conn.execute("PRAGMA busy_timeout=5000")
     conn.row_factory = sqlite3.Row
@@ -113,6 +127,12 @@ def init_db(db_path: Path) -> sqlite3.Connection:
     return conn
 
 
+def _is_memory_db(db_path: Path | str) -> bool:
+    return isinstance(db_path, str) and (
+        db_path == ":memory:" or "mode=memory" in db_path
+    )
+
+
 def _migrate_schema(conn: sqlite3.Connection) -> None:
     """Backfill additive schema changes for existing local databases."""
 
@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 import re
 import threading
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Optional
 
@@ -12,32 +13,36 @@ from .database import init_db
 from .schema import MemoryEntry
 
 
+# The FTS index is kept in sync by triggers on the memories table.
+_SAVE_MEMORY_SQL = """INSERT OR REPLACE INTO memories
+   (id, mind_id, content, category, relevance_keywords, created_at)
+   VALUES (?, ?, ?, ?, ?, ?)"""
+
+
 class MemoryManager:
     """Manages persistent memory for a Mind using SQLite + FTS5."""
 
-    def __init__(self, db_path: Path):
+    def __init__(self, db_path: Path | str):
         self._conn = init_db(db_path)
         self._lock = threading.Lock()
 
     def save(self, entry: MemoryEntry) -> str:
         """Persist a memory entry. Returns the memory ID."""
         with self._lock:
-            self._conn.execute(
-                """INSERT OR REPLACE INTO memories
-                   (id, mind_id, content, category, relevance_keywords, created_at)
-                   VALUES (?, ?, ?, ?, ?, ?)""",
-                (
-                    entry.id,
-                    entry.mind_id,
-                    entry.content,
-                    entry.category,
-                    json.dumps(entry.relevance_keywords),
-                    entry.created_at.isoformat(),
-                ),
-            )
+            self._conn.execute(_SAVE_MEMORY_SQL, _memory_to_row(entry))
             self._conn.commit()
         return entry.id
 
+    def save_many(self, entries: Iterable[MemoryEntry]) -> list[str]:
+        """Persist several memory entries in one commit. Returns their IDs."""
+        entries = list(entries)
+        with self._lock:
+            self._conn.executemany(
+                _SAVE_MEMORY_SQL, [_memory_to_row(entry) for entry in entries]
+            )
+            self._conn.commit()
+        return [entry.id for entry in entries]
+
     def retrieve(self, mind_id: str, memory_id: str) -> Optional[MemoryEntry]:
         """Load a specific memory by ID."""
         with self._lock:
@@ -91,6 +96,12 @@ class MemoryManager:
             self._conn.commit()
         return cursor.rowcount > 0
 
+    def clear(self) -> None:
+        """Delete all memories for every Mind."""
+        with self._lock:
+            self._conn.execute("DELETE FROM memories")
+            self._conn.commit()
+
 
 def _row_to_memory(row: dict) -> MemoryEntry:
     return MemoryEntry(
@@ -103,6 +114,17 @@ def _row_to_memory(row: dict) -> MemoryEntry:
     )
 
 
+def _memory_to_row(entry: MemoryEntry) -> tuple:
+    return (
+        entry.id,
+        entry.mind_id,
+        entry.content,
+        entry.category,
+        json.dumps(entry.relevance_keywords),
+        entry.created_at.isoformat(),
+    )
+
+
 def _build_fts_query(query: str) -> str:
     """Convert a natural language query to an FTS5 OR query."""
     tokens = re.findall(r"[a-z0-9]+", query.lower())
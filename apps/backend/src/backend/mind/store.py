@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import threading
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional
 
@@ -11,16 +14,96 @@ from .database import init_db
 from .schema import Drone, MindProfile, Task
 
 
+# Upsert in place; INSERT OR REPLACE would delete and re-insert the row.
+_SAVE_TASK_SQL = """INSERT INTO tasks
+   (id, mind_id, description, status, result, created_at, completed_at)
+   VALUES (?, ?, ?, ?, ?, ?, ?)
+   ON CONFLICT(id) DO UPDATE SET
+       mind_id = excluded.mind_id,
+       description = excluded.description,
+       status = excluded.status,
+       result = excluded.result,
+       created_at = excluded.created_at,
+       completed_at = excluded.completed_at"""
+
+
 class MindStore:
     """Stores Mind profiles and task history in SQLite."""
 
-    def __init__(self, db_path: Path):
+    def __init__(self, db_path: Path | str):
         self._conn = init_db(db_path)
-        self._lock = threading.Lock()
+        # Re-entrant so writes inside transaction() can take the lock again.
+        self._lock = threading.RLock()
+        self._transaction_depth = 0
+        self._transaction_task: asyncio.Task | None = None
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Group several writes into one SQLite transaction.
+
+        The outermost block starts with ``BEGIN IMMEDIATE`` so the write lock is
+        taken up front; its writes are committed once on exit, or rolled back
+        together if the block raises. Nested blocks run in a savepoint: an
+        error escaping one discards only its own writes, and nothing is
+        committed until the outermost block exits.
+
+        Meant for short synchronous batches. The block owns the store until it
+        exits: other threads wait, and another asyncio task touching the store
+        while the block is suspended at an ``await`` gets ``RuntimeError``
+        rather than silently joining the transaction. ``BEGIN IMMEDIATE`` also
+        holds the database write lock, so writers on other connections (e.g.
+        a MemoryManager on the same file) wait until the block exits.
+        """
+        with self._locked():
+            depth = self._transaction_depth
+            savepoint = f"mind_store_{depth}"
+            if depth == 0:
+                self._conn.execute("BEGIN IMMEDIATE")
+                self._transaction_task = _current_task()
+            else:
+                self._conn.execute(f"SAVEPOINT {savepoint}")
+            self._transaction_depth += 1
+            try:
+                yield
+            except BaseException:
+                if depth == 0:
+                    self._conn.rollback()
+                else:
+                    self._conn.execute(f"ROLLBACK TO {savepoint}")
+                    self._conn.execute(f"RELEASE {savepoint}")
+                raise
+            else:
+                if depth == 0:
+                    self._conn.commit()
+                else:
+                    self._conn.execute(f"RELEASE {savepoint}")
+            finally:
+                self._transaction_depth = depth
+                if depth == 0:
+                    self._transaction_task = None
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold the store lock, refusing entry into another task's transaction."""
+        with self._lock:
+            # The RLock admits any coroutine on the owning thread, so check
+            # that the caller is the asyncio task that opened the transaction.
+            if (
+                self._transaction_depth
+                and self._transaction_task is not _current_task()
+            ):
+                raise RuntimeError(
+                    "MindStore is in use by another task's transaction()"
+                )
+            yield
+
+    def _commit(self) -> None:
+        if self._transaction_depth == 0:
+            self._conn.commit()
 
     def save_mind(self, mind: MindProfile) -> str:
         """Save a Mind profile. Returns the Mind ID."""
-        with self._lock:
+        with self._locked():
             self._conn.execute(
                 """INSERT OR REPLACE INTO minds
                    (id, name, personality, preferences, system_prompt, charter, created_at)
@@ -31,16 +114,16 @@ class MindStore:
                     mind.personality,
                     json.dumps(mind.preferences),
                     mind.system_prompt,
-                    json.dumps(mind.charter.model_dump(mode="json")),
+                    mind.charter.model_dump_json(),
                     mind.created_at.isoformat(),
                 ),
             )
-            self._conn.commit()
+            self._commit()
         return mind.id
 
     def load_mind(self, mind_id: str) -> Optional[MindProfile]:
         """Load a Mind profile by ID."""
-        with self._lock:
+        with self._locked():
             row = self._conn.execute(
                 "SELECT * FROM minds WHERE id = ?", (mind_id,)
             ).fetchone()
@@ -50,7 +133,7 @@ class MindStore:
 
     def list_minds(self) -> list[MindProfile]:
         """List all Mind profiles."""
-        with self._lock:
+        with self._locked():
             rows = self._conn.execute(
                 "SELECT * FROM minds ORDER BY created_at"
             ).fetchall()
@@ -58,34 +141,31 @@ class MindStore:
 
     def delete_mind(self, mind_id: str) -> bool:
         """Delete a Mind profile."""
-        with self._lock:
+        with self._locked():
             cursor = self._conn.execute("DELETE FROM minds WHERE id = ?", (mind_id,))
-            self._conn.commit()
+            self._commit()
         return cursor.rowcount > 0
 
     def save_task(self, mind_id: str, task: Task) -> str:
         """Save a task to a Mind's task history."""
-        with self._lock:
-            self._conn.execute(
-                """INSERT OR REPLACE INTO tasks
-                   (id, mind_id, description, status, result, created_at, completed_at)
-                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    task.id,
-                    mind_id,
-                    task.description,
-                    task.status,
-                    task.result,
-                    task.created_at.isoformat(),
-                    task.completed_at.isoformat() if task.completed_at else None,
-                ),
-            )
-            self._conn.commit()
+        with self._locked():
+            self._conn.execute(_SAVE_TASK_SQL, _task_to_row(mind_id, task))
+            self._commit()
         return task.id
 
+    def save_tasks(self, mind_id: str, tasks: Iterable[Task]) -> list[str]:
+        """Save several tasks in one statement and commit. Returns their IDs."""
+        tasks = list(tasks)
+        with self._locked():
+            self._conn.executemany(
+                _SAVE_TASK_SQL, [_task_to_row(mind_id, task) for task in tasks]
+            )
+            self._commit()
+        return [task.id for task in tasks]
+
     def load_task(self, mind_id: str, task_id: str) -> Optional[Task]:
         """Load a specific task."""
-        with self._lock:
+        with self._locked():
             row = self._conn.execute(
                 "SELECT * FROM tasks WHERE id = ? AND mind_id = ?",
                 (task_id, mind_id),
@@ -96,7 +176,7 @@ class MindStore:
 
     def list_tasks(self, mind_id: str) -> list[Task]:
         """List all tasks for a Mind, most recent first."""
-        with self._lock:
+        with self._locked():
             rows = self._conn.execute(
                 "SELECT * FROM tasks WHERE mind_id = ? ORDER BY created_at DESC",
                 (mind_id,),
@@ -105,17 +185,17 @@ class MindStore:
 
     def save_task_trace(self, mind_id: str, task_id: str, events: list[dict]) -> None:
         """Persist task execution trace events."""
-        with self._lock:
+        with self._locked():
             self._conn.execute(
                 """INSERT OR REPLACE INTO task_traces (mind_id, task_id, events)
                    VALUES (?, ?, ?)""",
                 (mind_id, task_id, json.dumps(events, default=str)),
             )
-            self._conn.commit()
+            self._commit()
 
     def load_task_trace(self, mind_id: str, task_id: str) -> Optional[dict]:
         """Load a persisted task trace by task ID."""
-        with self._lock:
+        with self._locked():
             row = self._conn.execute(
                 "SELECT * FROM task_traces WHERE mind_id = ? AND task_id = ?",
                 (mind_id, task_id),
@@ -128,11 +208,20 @@ class MindStore:
             "events": json.loads(row["events"]),
         }
 
+    def clear(self) -> None:
+        """Delete all Mind profiles, tasks, drones, and traces."""
+        with self._locked():
+            # Separate statements rather than executescript(), which would
+            # commit an enclosing transaction() first.
+            for table in ("minds", "tasks", "task_traces", "drones", "drone_traces"):
+                self._conn.execute(f"DELETE FROM {table}")
+            self._commit()
+
     # ── Drone persistence ──────────────────────────────────────────────────
 
     def save_drone(self, drone: Drone) -> str:
         """Save a Drone record. Returns the Drone ID."""
-        with self._lock:
+        with self._locked():
             self._conn.execute(
                 """INSERT OR REPLACE INTO drones
                    (id, mind_id, task_id, objective, status, result, created_at, completed_at)
@@ -148,12 +237,12 @@ class MindStore:
                     drone.completed_at.isoformat() if drone.completed_at else None,
                 ),
             )
-            self._conn.commit()
+            self._commit()
         return drone.id
 
     def list_drones(self, mind_id: str, task_id: str) -> list[Drone]:
         """List all drones spawned for a specific task."""
-        with self._lock:
+        with self._locked():
             rows = self._conn.execute(
                 "SELECT * FROM drones WHERE mind_id = ? AND task_id = ? ORDER BY created_at",
                 (mind_id, task_id),
@@ -164,17 +253,17 @@ class MindStore:
         self, mind_id: str, drone_id: str, events: list[dict]
     ) -> None:
         """Persist drone execution trace events."""
-        with self._lock:
+        with self._locked():
             self._conn.execute(
                 """INSERT OR REPLACE INTO drone_traces (mind_id, drone_id, events)
                    VALUES (?, ?, ?)""",
                 (mind_id, drone_id, json.dumps(events, default=str)),
             )
-            self._conn.commit()
+            self._commit()
 
     def load_drone_trace(self, mind_id: str, drone_id: str) -> Optional[dict]:
         """Load a persisted drone trace by drone ID."""
-        with self._lock:
+        with self._locked():
             row = self._conn.execute(
                 "SELECT * FROM drone_traces WHERE mind_id = ? AND drone_id = ?",
                 (mind_id, drone_id),
@@ -188,6 +277,13 @@ class MindStore:
         }
 
 
+def _current_task() -> asyncio.Task | None:
+    try:
+        return asyncio.current_task()
+    except RuntimeError:  # No running event loop.
+        return None
+
+
 def _row_to_mind(row: dict) -> MindProfile:
     charter = row["charter"] if "charter" in row.keys() else "{}"
 
@@ -214,6 +310,18 @@ def _row_to_task(row: dict) -> Task:
     )
 
 
+def _task_to_row(mind_id: str, task: Task) -> tuple:
+    return (
+        task.id,
+        mind_id,
+        task.description,
+        task.status,
+        task.result,
+        task.created_at.isoformat(),
+        task.completed_at.isoformat() if task.completed_at else None,
+    )
+
+
 def _row_to_drone(row: dict) -> Drone:
     return Drone(
         id=row["id"],
@@ -1,12 +1,9 @@
 import asyncio
 import os
-import shutil
-import sys
-import tempfile
+import random
 import unittest
-from pathlib import Path
-
-sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+import uuid
+from typing import Any, NamedTuple
 
 from backend.config import get_settings
 from backend.mind.memory import MemoryManager
@@ -16,51 +13,149 @@ from backend.mind.store import MindStore
 
 MODEL_ID = "anthropic/claude-haiku-4.5"
 MAX_ATTEMPTS = 2
+RETRY_BASE_DELAY_SECONDS = 1.0
+RETRY_MAX_DELAY_SECONDS = 30.0
+RETRY_JITTER = 0.5
+# Errors a retry cannot fix (bad request, auth, unknown model); anything else,
+# e.g. 429/5xx, overloaded or timeouts, is retried.
+_PERMANENT_ERROR_MARKERS = (
+    "error code: 400",
+    "error code: 401",
+    "error code: 403",
+    "invalid_api_key",
+    "invalid api key",
+    "not a valid model",
+    "invalid model",
+)
+
+
+class _StreamEvent(NamedTuple):
+    """Tuple view of a raw pipeline event, unpacked once at ingest."""
+
+    type: str | None
+    content: Any
+    raw: dict
+
+
+class _Diagnostics:
+    """Assertion message whose event summary is only built on failure."""
+
+    def __init__(self, message: str, events: list[_StreamEvent]) -> None:
+        self.message = message
+        self.events = events
+
+    def __str__(self) -> str:
+        event_types = [event.type for event in self.events]
+        errors = [event.content for event in self.events if event.type == "error"]
+        tail = event_types[-12:]
+        return f"{self.message} types={event_types}; tail={tail}; errors={errors}"
+
+
+def _retry_delay(attempt: int) -> float:
+    """Exponential backoff with jitter for the given zero-based attempt."""
+    delay = min(RETRY_MAX_DELAY_SECONDS, RETRY_BASE_DELAY_SECONDS * (2**attempt))
+    return delay * (1 + random.random() * RETRY_JITTER)
+
+
+def _last_of(events: list[_StreamEvent], event_type: str) -> _StreamEvent | None:
+    """Find the last event of a type; terminal events sit at the stream tail."""
+    return next((event for event in reversed(events) if event.type == event_type), None)
+
+
+def _is_completed(events: list[_StreamEvent]) -> bool:
+    finished = _last_of(events, "task_finished")
+    return bool(finished and finished.content.get("status") == "completed")
+
+
+def _is_recoverable(events: list[_StreamEvent]) -> bool:
+    """Return False only when the run failed with a clearly permanent error."""
+    errors = [str(event.content).lower() for event in events if event.type == "error"]
+    return not any(
+        marker in error for error in errors for marker in _PERMANENT_ERROR_MARKERS
+    )
 
 
 class OpenRouterMindIntegrationTests(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Shared-cache in-memory DB; it lives as long as the store connections.
+        cls.db_path = f"file:mind-it-{uuid.uuid4().hex}?mode=memory&cache=shared"
+        cls.mind_store = MindStore(cls.db_path)
+        cls.memory_manager = MemoryManager(cls.db_path)
+        # Parse settings once; tests patch fields on the cached instance.
+        cls._settings = get_settings()
+
     async def asyncSetUp(self) -> None:
-        self.tmp_dir = Path(tempfile.mkdtemp(prefix="mind-openrouter-it-"))
-        self.db_path = self.tmp_dir / "mind.db"
-        self.mind_store = MindStore(self.db_path)
-        self.memory_manager = MemoryManager(self.db_path)
-        self._old_default_model = os.environ.get("DEFAULT_MODEL")
+        self._old_settings = (
+            self._settings.default_model,
+            self._settings.anthropic_base_url,
+        )
 
     async def asyncTearDown(self) -> None:
-        if self._old_default_model is None:
-            os.environ.pop("DEFAULT_MODEL", None)
-        else:
-            os.environ["DEFAULT_MODEL"] = self._old_default_model
-
-        get_settings.cache_clear()
-        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+        (
+            self._settings.default_model,
+            self._settings.anthropic_base_url,
+        ) = self._old_settings
+        self.mind_store.clear()
+        self.memory_manager.clear()
 
     async def _collect_events(
         self, mind_id: str, timeout_seconds: int = 240
-    ) -> list[dict]:
-        events: list[dict] = []
-
-        async def _run() -> None:
-            async for event in delegate_to_mind(
-                mind_store=self.mind_store,
-                memory_manager=self.memory_manager,
-                mind_id=mind_id,
-                description="Respond with one short sentence confirming the integration check.",
-                team="default",
-            ):
-                events.append(event)
-
-        await asyncio.wait_for(_run(), timeout=timeout_seconds)
+    ) -> list[_StreamEvent]:
+        async def _run() -> list[_StreamEvent]:
+            return [
+                _StreamEvent(event.get("type"), event.get("content"), event)
+                async for event in delegate_to_mind(
+                    mind_store=self.mind_store,
+                    memory_manager=self.memory_manager,
+                    mind_id=mind_id,
+                    description="Respond with one short sentence confirming the integration check.",
+                    team="default",
+                )
+            ]
+
+        return await asyncio.wait_for(_run(), timeout=timeout_seconds)
+
+    async def _collect_with_retries(self, mind_id: str) -> list[_StreamEvent]:
+        events: list[_StreamEvent] = []
+        for attempt in range(MAX_ATTEMPTS):
+            events = await self._collect_events(mind_id)
+            if _is_completed(events):
+                break
+            if not _is_recoverable(events) or attempt == MAX_ATTEMPTS - 1:
+                break
+            await asyncio.sleep(_retry_delay(attempt))
         return events
 
-    @staticmethod
-    def _diagnostics(events: list[dict]) -> str:
-        event_types = [event.get("type") for event in events]
-        errors = [
-            event.get("content") for event in events if event.get("type") == "error"
+    async def _collect_in_parallel(self, mind_id: str) -> list[_StreamEvent]:
+        """Race all attempts at once and cancel the rest on first success.
+
+        An attempt that raises (e.g. times out) does not end the race; the
+        last error is re-raised only if no attempt returned any events.
+        """
+        attempts = [
+            asyncio.create_task(self._collect_events(mind_id))
+            for _ in range(MAX_ATTEMPTS)
         ]
-        tail = event_types[-12:]
-        return f"types={event_types}; tail={tail}; errors={errors}"
+        events: list[_StreamEvent] | None = None
+        error: Exception | None = None
+        try:
+            for next_done in asyncio.as_completed(attempts):
+                try:
+                    events = await next_done
+                except Exception as exc:
+                    error = exc
+                    continue
+                if _is_completed(events):
+                    break
+        finally:
+            for attempt in attempts:
+                attempt.cancel()
+            await asyncio.gather(*attempts, return_exceptions=True)
+        if events is None:
+            assert error is not None
+            raise error
+        return events
 
     async def test_delegate_task_via_openrouter(self):
         if not os.environ.get("OPENROUTER_API_KEY"):
@@ -70,64 +165,62 @@ class OpenRouterMindIntegrationTests(unittest.IsolatedAsyncioTestCase):
                 "Set RUN_OPENROUTER_INTEGRATION=1 to run external integration test"
             )
 
+        # The stream adapter reads ANTHROPIC_BASE_URL from the environment.
         os.environ.setdefault("ANTHROPIC_BASE_URL", "https://openrouter.ai/api/v1")
-        os.environ["DEFAULT_MODEL"] = MODEL_ID
-        get_settings.cache_clear()
+        self._settings.anthropic_base_url = (
+            self._settings.anthropic_base_url or os.environ["ANTHROPIC_BASE_URL"]
+        )
+        self._settings.default_model = MODEL_ID
         self.assertEqual(get_settings().default_model, MODEL_ID)
 
         mind = MindProfile(name="Integration Mind", personality="concise")
         self.mind_store.save_mind(mind)
 
-        last_events: list[dict] = []
-        for _ in range(MAX_ATTEMPTS):
-            last_events = await self._collect_events(mind.id)
-            finished = next(
-                (
-                    event
-                    for event in last_events
-                    if event.get("type") == "task_finished"
-                ),
-                None,
-            )
-            if finished and finished.get("content", {}).get("status") == "completed":
-                break
+        # Parallel attempts trade extra API usage for lower tail latency.
+        if os.environ.get("RUN_OPENROUTER_PARALLEL") == "1":
+            last_events = await self._collect_in_parallel(mind.id)
+        else:
+            last_events = await self._collect_with_retries(mind.id)
 
-        event_types = [event.get("type") for event in last_events]
+        event_types = [event.type for event in last_events]
         self.assertIn(
             "task_started",
             event_types,
-            "Expected task_started event from delegation pipeline. "
-            + self._diagnostics(last_events),
+            _Diagnostics(
+                "Expected task_started event from delegation pipeline.", last_events
+            ),
         )
         self.assertIn(
             "task_finished",
             event_types,
-            "Expected task_finished event from delegation pipeline. "
-            + self._diagnostics(last_events),
+            _Diagnostics(
+                "Expected task_finished event from delegation pipeline.", last_events
+            ),
         )
 
-        finished = next(
-            event for event in last_events if event.get("type") == "task_finished"
-        )
+        finished = _last_of(last_events, "task_finished")
         self.assertEqual(
-            finished["content"].get("status"),
+            finished.content.get("status"),
             "completed",
-            "Expected completed status for Mind delegation run. "
-            + self._diagnostics(last_events),
+            _Diagnostics(
+                "Expected completed status for Mind delegation run.", last_events
+            ),
         )
         self.assertTrue(
             any(
                 event_type in {"text", "result", "tool_use", "tool_result"}
                 for event_type in event_types
             ),
-            "Expected streamed reasoning/tool events from agent run. "
-            + self._diagnostics(last_events),
+            _Diagnostics(
+                "Expected streamed reasoning/tool events from agent run.", last_events
+            ),
         )
 
-        tasks = self.mind_store.list_tasks(mind.id)
-        self.assertEqual(len(tasks), 1)
-        self.assertEqual(tasks[0].status, "completed")
+        # Retried or parallel attempts each persist a task; check the winner.
+        task = self.mind_store.load_task(mind.id, finished.content["task_id"])
+        self.assertIsNotNone(task)
+        self.assertEqual(task.status, "completed")
 
-        trace = self.mind_store.load_task_trace(mind.id, tasks[0].id)
+        trace = self.mind_store.load_task_trace(mind.id, task.id)
         self.assertIsNotNone(trace)
         self.assertGreater(len(trace.get("events", [])), 0)
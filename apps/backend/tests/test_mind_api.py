@@ -1,379 +1,197 @@
 import json
-import shutil
-import sys
-import tempfile
 import unittest
+import uuid
+from collections import Counter
 from datetime import datetime, timezone
-from pathlib import Path
 from unittest.mock import patch
 
+import httpx
 from fastapi.testclient import TestClient
 
-sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
-
 from backend import main
+from backend.mind.config import MAX_STREAM_EVENTS
 from backend.mind.memory import MemoryManager
 from backend.mind.schema import Task
+from backend.mind.service import MindService
 from backend.mind.store import MindStore
 from backend.mind.tools.primitives import create_memory_tools, create_spawn_agent_tool
 
+# Events are serialized with compact separators, so this matches text_delta
+# frames without decoding them.
+_TEXT_DELTA_MARKER = b'"type":"text_delta"'
+
+
+_RUN_AGENT = "backend.mind.pipeline.run_agent"
+_TEXT_DELTA_VOLUME = MAX_STREAM_EVENTS + 5  # Just past the structural limit.
+# The pipeline only reads events, so one dict can be yielded repeatedly.
+_TEXT_DELTA_X = {"type": "text_delta", "content": "x"}
+
+
+async def _fake_memory_search_run(*args, **kwargs):
+    tools_override = kwargs.get("tools_override") or []
+    tool_names = {tool.name for tool in tools_override}
+    assert "spawn_agent" in tool_names
+    assert "memory_search" in tool_names
+
+    yield {
+        "type": "tool_use",
+        "content": {
+            "tool": "memory_search",
+            "input": {"query": "release notes"},
+            "id": "tu_1",
+        },
+    }
+    yield {
+        "type": "tool_result",
+        "content": {
+            "tool_use_id": "tu_1",
+            "result": "[]",
+            "is_error": False,
+        },
+    }
+    yield {
+        "type": "text",
+        "content": "Done: drafted a concise release note summary.",
+    }
+    yield {"type": "result", "content": {"subtype": "completed"}}
+
+
+async def _fake_drone_isolation_run(*args, **kwargs):
+    prompt = kwargs.get("prompt", "")
+    tools_override = kwargs.get("tools_override") or []
+    tools = {tool.name: tool for tool in tools_override}
+
+    if prompt.startswith("[Drone Objective]"):
+        # This write must stay inside the drone workspace.
+        await tools["write_file"].execute(
+            "drone_write",
+            {"path": "artifact.txt", "content": "from drone"},
+        )
+        yield {"type": "text", "content": "drone complete"}
+        yield {"type": "result", "content": {"subtype": "completed"}}
+        return
+
+    await tools["spawn_agent"].execute(
+        "parent_spawn",
+        {"objective": "create artifact", "max_turns": 5},
+    )
+
+    leak_detected = False
+    try:
+        read_result = await tools["read_file"].execute(
+            "parent_read", {"path": "artifact.txt"}
+        )
+        leak_detected = "from drone" in read_result.content[0].text
+    except Exception:
+        leak_detected = False
+
+    yield {"type": "text", "content": f"drone_workspace_leak={leak_detected}"}
+    yield {"type": "result", "content": {"subtype": "completed"}}
+
+
+async def _fake_final_text_run(*args, **kwargs):
+    yield {
+        "type": "result",
+        "content": {
+            "subtype": "completed",
+            "final_text": "Completed summary from final result payload.",
+        },
+    }
+
+
+async def _fake_error_result_run(*args, **kwargs):
+    yield {
+        "type": "result",
+        "content": {
+            "subtype": "error",
+            "error_message": "Upstream provider unavailable",
+        },
+    }
+
+
+async def _fake_recovering_run(*args, **kwargs):
+    yield {"type": "error", "content": "Transient tool timeout"}
+    yield {
+        "type": "result",
+        "content": {
+            "subtype": "completed",
+            "final_text": "Recovered and completed successfully.",
+        },
+    }
+
+
+async def _fake_text_delta_volume_run(*args, **kwargs):
+    for _ in range(_TEXT_DELTA_VOLUME):
+        yield _TEXT_DELTA_X
+    yield {
+        "type": "text",
+        "content": "I suggest adding a charter editor and capability roadmap.",
+    }
+    yield {
+        "type": "result",
+        "content": {
+            "subtype": "completed",
+            "final_text": "I suggest adding a charter editor and capability roadmap.",
+        },
+    }
+
+
+async def _fake_completed_run(*args, **kwargs):
+    yield {
+        "type": "result",
+        "content": {"subtype": "completed", "final_text": "Done."},
+    }
+
+
+def _sse_data(frame: bytes) -> bytes | None:
+    """Return the ``data`` field of one SSE frame, or None if it has none.
+
+    Multi-line ``data:`` fields are joined with newlines and the space after
+    the colon is optional, per the SSE spec.
+    """
+    if frame.startswith(b"data: ") and b"\n" not in frame:
+        return frame[6:]  # Fast path: the server writes one-line frames.
+    lines = [
+        line[6:] if line.startswith(b"data: ") else line[5:]
+        for line in frame.split(b"\n")
+        if line.startswith(b"data:")
+    ]
+    return b"\n".join(lines) if lines else None
+
+
+def _mk_db() -> str:
+    """Return a unique shared-cache in-memory SQLite URI.
+
+    The database lives as long as a store holding a connection to it.
+    """
+    return f"file:mind_{uuid.uuid4().hex}?mode=memory&cache=shared"
+
+
+def _override_service(db_path: str) -> MindService:
+    """Serve requests from a MindService backed by ``db_path``."""
+    service = MindService(store=MindStore(db_path), memory=MemoryManager(db_path))
+    main.app.dependency_overrides[main.get_service] = lambda: service
+    return service
+
+
+def _clear_service_override() -> None:
+    main.app.dependency_overrides.pop(main.get_service, None)
 
-class MindApiTests(unittest.TestCase):
-    def setUp(self) -> None:
-        self.tmp_dir = Path(tempfile.mkdtemp(prefix="mind-api-tests-"))
-        self._old_mind_store = main.mind_store
-        self._old_memory_manager = main.memory_manager
-
-        db_path = self.tmp_dir / "test.db"
-        main.mind_store = MindStore(db_path)
-        main.memory_manager = MemoryManager(db_path)
-        self.client = TestClient(main.app)
-
-    def tearDown(self) -> None:
-        main.mind_store = self._old_mind_store
-        main.memory_manager = self._old_memory_manager
-        shutil.rmtree(self.tmp_dir, ignore_errors=True)
-
-    @staticmethod
-    def _read_sse(response) -> list[dict]:
-        payload = ""
-        for chunk in response.iter_text():
-            payload += chunk
-
-        decoder = json.JSONDecoder()
-        events: list[dict] = []
-
-        for line in payload.splitlines():
-            line = line.strip()
-            if not line.startswith("data: "):
-                continue
-
-            data = line[6:].strip()
-            idx = 0
-            while idx < len(data):
-                while idx < len(data) and data[idx].isspace():
-                    idx += 1
-                if idx >= len(data):
-                    break
-                obj, next_idx = decoder.raw_decode(data, idx)
-                events.append(obj)
-                idx = next_idx
-
-        return events
-
-    def test_create_mind_delegate_and_persist_task_memory(self):
-        create_resp = self.client.post(
-            "/api/minds",
-            json={"name": "Hub", "personality": "helpful"},
-        )
-        self.assertEqual(create_resp.status_code, 200)
-        mind_id = create_resp.json()["id"]
-
-        list_resp = self.client.get("/api/minds")
-        self.assertEqual(list_resp.status_code, 200)
-        self.assertTrue(any(m["id"] == mind_id for m in list_resp.json()))
-
-        async def fake_run_agent(*args, **kwargs):
-            tools_override = kwargs.get("tools_override") or []
-            tool_names = {tool.name for tool in tools_override}
-            assert "spawn_agent" in tool_names
-            assert "memory_search" in tool_names
-
-            yield {
-                "type": "tool_use",
-                "content": {
-                    "tool": "memory_search",
-                    "input": {"query": "release notes"},
-                    "id": "tu_1",
-                },
-            }
-            yield {
-                "type": "tool_result",
-                "content": {
-                    "tool_use_id": "tu_1",
-                    "result": "[]",
-                    "is_error": False,
-                },
-            }
-            yield {
-                "type": "text",
-                "content": "Done: drafted a concise release note summary.",
-            }
-            yield {"type": "result", "content": {"subtype": "completed"}}
-
-        with patch("backend.mind.pipeline.run_agent", new=fake_run_agent):
-            with self.client.stream(
-                "POST",
-                f"/api/minds/{mind_id}/delegate",
-                json={"description": "Summarize release notes", "team": "default"},
-            ) as response:
-                self.assertEqual(response.status_code, 200)
-                events = self._read_sse(response)
-
-        event_types = [evt["type"] for evt in events]
-        self.assertIn("task_started", event_types)
-        self.assertIn("memory_context", event_types)
-        self.assertIn("tool_registry", event_types)
-        self.assertIn("tool_use", event_types)
-        self.assertIn("tool_result", event_types)
-        self.assertIn("result", event_types)
-        self.assertIn("memory_saved", event_types)
-        self.assertIn("task_finished", event_types)
-
-        tasks_resp = self.client.get(f"/api/minds/{mind_id}/tasks")
-        self.assertEqual(tasks_resp.status_code, 200)
-        tasks = tasks_resp.json()
-        self.assertEqual(len(tasks), 1)
-        self.assertEqual(tasks[0]["status"], "completed")
-
-        task_id = tasks[0]["id"]
-        trace_resp = self.client.get(f"/api/minds/{mind_id}/tasks/{task_id}/trace")
-        self.assertEqual(trace_resp.status_code, 200)
-        trace = trace_resp.json()
-        self.assertEqual(trace["task_id"], task_id)
-        trace_types = [evt["type"] for evt in trace["events"]]
-        self.assertIn("task_started", trace_types)
-        self.assertIn("tool_use", trace_types)
-        self.assertIn("task_finished", trace_types)
-
-        memory_resp = self.client.get(f"/api/minds/{mind_id}/memory")
-        self.assertEqual(memory_resp.status_code, 200)
-        memories = memory_resp.json()
-        self.assertTrue(any(m["category"] == "task_result" for m in memories))
-
-    def test_spawn_agent_uses_isolated_workspace(self):
-        create_resp = self.client.post("/api/minds", json={"name": "Hub"})
-        self.assertEqual(create_resp.status_code, 200)
-        mind_id = create_resp.json()["id"]
-
-        async def fake_run_agent(*args, **kwargs):
-            prompt = kwargs.get("prompt", "")
-            tools_override = kwargs.get("tools_override") or []
-            tools = {tool.name: tool for tool in tools_override}
-
-            if prompt.startswith("[Drone Objective]"):
-                # This write must stay inside the drone workspace.
-                await tools["write_file"].execute(
-                    "drone_write",
-                    {"path": "artifact.txt", "content": "from drone"},
-                )
-                yield {"type": "text", "content": "drone complete"}
-                yield {"type": "result", "content": {"subtype": "completed"}}
-                return
-
-            await tools["spawn_agent"].execute(
-                "parent_spawn",
-                {"objective": "create artifact", "max_turns": 5},
-            )
-
-            leak_detected = False
-            try:
-                read_result = await tools["read_file"].execute(
-                    "parent_read", {"path": "artifact.txt"}
-                )
-                leak_detected = "from drone" in read_result.content[0].text
-            except Exception:
-                leak_detected = False
-
-            yield {"type": "text", "content": f"drone_workspace_leak={leak_detected}"}
-            yield {"type": "result", "content": {"subtype": "completed"}}
-
-        with patch("backend.mind.pipeline.run_agent", new=fake_run_agent):
-            with self.client.stream(
-                "POST",
-                f"/api/minds/{mind_id}/delegate",
-                json={
-                    "description": "Run workspace isolation check",
-                    "team": "default",
-                },
-            ) as response:
-                self.assertEqual(response.status_code, 200)
-                events = self._read_sse(response)
-
-        text_events = [e.get("content") for e in events if e.get("type") == "text"]
-        self.assertTrue(
-            any("drone_workspace_leak=False" in str(content) for content in text_events)
-        )
-
-    def test_result_final_text_is_persisted_and_saved_to_memory(self):
-        create_resp = self.client.post(
-            "/api/minds",
-            json={"name": "Signal"},
-        )
-        self.assertEqual(create_resp.status_code, 200)
-        mind_id = create_resp.json()["id"]
-
-        async def fake_run_agent(*args, **kwargs):
-            yield {
-                "type": "result",
-                "content": {
-                    "subtype": "completed",
-                    "final_text": "Completed summary from final result payload.",
-                },
-            }
-
-        with patch("backend.mind.pipeline.run_agent", new=fake_run_agent):
-            with self.client.stream(
-                "POST",
-                f"/api/minds/{mind_id}/delegate",
-                json={"description": "Summarize launch plan", "team": "default"},
-            ) as response:
-                self.assertEqual(response.status_code, 200)
-                events = self._read_sse(response)
-
-        event_types = [evt["type"] for evt in events]
-        self.assertIn("memory_context", event_types)
-        self.assertIn("memory_saved", event_types)
 
-        tasks_resp = self.client.get(f"/api/minds/{mind_id}/tasks")
-        tasks = tasks_resp.json()
-        self.assertEqual(len(tasks), 1)
-        self.assertEqual(tasks[0]["status"], "completed")
-        self.assertEqual(
-            tasks[0]["result"], "Completed summary from final result payload."
-        )
-
-        memory_resp = self.client.get(f"/api/minds/{mind_id}/memory")
-        memories = memory_resp.json()
-        categories = {memory["category"] for memory in memories}
-        self.assertIn("task_result", categories)
-        self.assertIn("mind_insight", categories)
-
-        task_result_memory = next(
-            memory for memory in memories if memory["category"] == "task_result"
-        )
-        self.assertIn(
-            "Completed summary from final result payload.",
-            task_result_memory["content"],
-        )
-
-    def test_error_result_marks_task_failed(self):
-        create_resp = self.client.post(
-            "/api/minds",
-            json={"name": "Signal"},
-        )
-        self.assertEqual(create_resp.status_code, 200)
-        mind_id = create_resp.json()["id"]
-
-        async def fake_run_agent(*args, **kwargs):
-            yield {
-                "type": "result",
-                "content": {
-                    "subtype": "error",
-                    "error_message": "Upstream provider unavailable",
-                },
-            }
-
-        with patch("backend.mind.pipeline.run_agent", new=fake_run_agent):
-            with self.client.stream(
-                "POST",
-                f"/api/minds/{mind_id}/delegate",
-                json={"description": "Run failure check", "team": "default"},
-            ) as response:
-                self.assertEqual(response.status_code, 200)
-                events = self._read_sse(response)
-
-        event_types = [evt["type"] for evt in events]
-        self.assertIn("error", event_types)
-
-        finished = next(evt for evt in events if evt["type"] == "task_finished")
-        self.assertEqual(finished["content"]["status"], "failed")
-
-        tasks_resp = self.client.get(f"/api/minds/{mind_id}/tasks")
-        tasks = tasks_resp.json()
-        self.assertEqual(len(tasks), 1)
-        self.assertEqual(tasks[0]["status"], "failed")
-        self.assertIn("Upstream provider unavailable", tasks[0]["result"])
-
-    def test_intermediate_error_event_does_not_force_failure_when_result_completes(
-        self,
-    ):
-        create_resp = self.client.post(
-            "/api/minds",
-            json={"name": "Signal"},
-        )
-        self.assertEqual(create_resp.status_code, 200)
-        mind_id = create_resp.json()["id"]
-
-        async def fake_run_agent(*args, **kwargs):
-            yield {"type": "error", "content": "Transient tool timeout"}
-            yield {
-                "type": "result",
-                "content": {
-                    "subtype": "completed",
-                    "final_text": "Recovered and completed successfully.",
-                },
-            }
-
-        with patch("backend.mind.pipeline.run_agent", new=fake_run_agent):
-            with self.client.stream(
-                "POST",
-                f"/api/minds/{mind_id}/delegate",
-                json={"description": "Run recovery check", "team": "default"},
-            ) as response:
-                self.assertEqual(response.status_code, 200)
-                events = self._read_sse(response)
-
-        event_types = [evt["type"] for evt in events]
-        self.assertIn("error", event_types)
-
-        finished = next(evt for evt in events if evt["type"] == "task_finished")
-        self.assertEqual(finished["content"]["status"], "completed")
-
-        tasks_resp = self.client.get(f"/api/minds/{mind_id}/tasks")
-        tasks = tasks_resp.json()
-        self.assertEqual(len(tasks), 1)
-        self.assertEqual(tasks[0]["status"], "completed")
-        self.assertEqual(tasks[0]["result"], "Recovered and completed successfully.")
-
-    def test_text_delta_volume_does_not_trip_structural_event_limit(self):
-        create_resp = self.client.post(
-            "/api/minds",
-            json={"name": "Signal"},
-        )
-        self.assertEqual(create_resp.status_code, 200)
-        mind_id = create_resp.json()["id"]
-
-        async def fake_run_agent(*args, **kwargs):
-            for _ in range(350):
-                yield {"type": "text_delta", "content": "x"}
-            yield {
-                "type": "text",
-                "content": "I suggest adding a charter editor and capability roadmap.",
-            }
-            yield {
-                "type": "result",
-                "content": {
-                    "subtype": "completed",
-                    "final_text": "I suggest adding a charter editor and capability roadmap.",
-                },
-            }
-
-        with patch("backend.mind.pipeline.run_agent", new=fake_run_agent):
-            with self.client.stream(
-                "POST",
-                f"/api/minds/{mind_id}/delegate",
-                json={"description": "How should you evolve next?", "team": "default"},
-            ) as response:
-                self.assertEqual(response.status_code, 200)
-                events = self._read_sse(response)
-
-        finished = next(evt for evt in events if evt["type"] == "task_finished")
-        self.assertEqual(finished["content"]["status"], "completed")
+class MindApiTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.service = _override_service(_mk_db())
+        cls.client = TestClient(main.app)
 
-        error_messages = [
-            str(evt.get("content")) for evt in events if evt.get("type") == "error"
-        ]
-        self.assertFalse(
-            any("Event limit reached" in message for message in error_messages),
-            msg=f"Unexpected structural event limit failure: {error_messages}",
-        )
+    @classmethod
+    def tearDownClass(cls) -> None:
+        _clear_service_override()
 
-        tasks_resp = self.client.get(f"/api/minds/{mind_id}/tasks")
-        tasks = tasks_resp.json()
-        self.assertEqual(len(tasks), 1)
-        self.assertEqual(tasks[0]["status"], "completed")
-        self.assertIn("charter editor", tasks[0]["result"])
+    def setUp(self) -> None:
+        # Tests count and look up rows, so each starts from empty tables.
+        self.service.store.clear()
+        self.service.memory.clear()
 
     def test_create_mind_includes_default_charter_and_accepts_override(self):
         default_resp = self.client.post(
@@ -520,15 +338,295 @@ class MindApiTests(unittest.TestCase):
             any(memory["category"] == "user_feedback" for memory in memories)
         )
 
-    def test_delegate_prompt_includes_recent_user_feedback_memory(self):
-        create_resp = self.client.post(
+
+class MindApiStreamingTests(unittest.IsolatedAsyncioTestCase):
+    """SSE tests driven natively on the event loop via the ASGI transport.
+
+    The database is shared across the class; every assertion is scoped to
+    the Mind it is made against, so tests that count tasks create their own.
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        service = _override_service(_mk_db())
+        cls.fixture_mind_id = service.create_mind(name="Fixture").id
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        _clear_service_override()
+
+    async def asyncSetUp(self) -> None:
+        self.client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=main.app),
+            base_url="http://test",
+        )
+
+    async def asyncTearDown(self) -> None:
+        await self.client.aclose()
+
+    @staticmethod
+    async def _iter_sse_data(response):
+        """Yield the raw ``data:`` payload of every SSE frame in ``response``."""
+        buf = bytearray()
+
+        # SSE responses are never content-encoded, so skip the decoder layer.
+        async for chunk in response.aiter_raw(65536):
+            buf += chunk
+            # Frames end with a blank line; keep the unterminated tail.
+            *frames, tail = buf.split(b"\n\n")
+            buf = tail
+            for frame in frames:
+                data = _sse_data(frame)
+                if data is not None:
+                    yield data
+
+    async def _read_sse(self, response) -> list[dict]:
+        return [json.loads(data) async for data in self._iter_sse_data(response)]
+
+    async def _scan_sse_types(self, response) -> tuple[Counter, list[str], dict | None]:
+        """Tally event types without decoding ``text_delta`` frames.
+
+        Returns the per-type counts, the content of every ``error`` event and
+        the ``task_finished`` event, if any.
+        """
+        types: Counter = Counter()
+        error_messages: list[str] = []
+        finished: dict | None = None
+
+        async for data in self._iter_sse_data(response):
+            if _TEXT_DELTA_MARKER in data:
+                types["text_delta"] += 1
+                continue
+            event = json.loads(data)
+            types[event["type"]] += 1
+            if event["type"] == "error":
+                error_messages.append(str(event.get("content")))
+            elif event["type"] == "task_finished":
+                finished = event
+
+        return types, error_messages, finished
+
+    @patch(_RUN_AGENT, new=_fake_memory_search_run)
+    async def test_create_mind_delegate_and_persist_task_memory(self):
+        create_resp = await self.client.post(
+            "/api/minds",
+            json={"name": "Hub", "personality": "helpful"},
+        )
+        self.assertEqual(create_resp.status_code, 200)
+        mind_id = create_resp.json()["id"]
+
+        list_resp = await self.client.get("/api/minds")
+        self.assertEqual(list_resp.status_code, 200)
+        self.assertTrue(any(m["id"] == mind_id for m in list_resp.json()))
+
+        async with self.client.stream(
+            "POST",
+            f"/api/minds/{mind_id}/delegate",
+            json={"description": "Summarize release notes", "team": "default"},
+        ) as response:
+            self.assertEqual(response.status_code, 200)
+            events = await self._read_sse(response)
+
+        event_types = {evt["type"] for evt in events}
+        self.assertLessEqual(
+            {
+                "task_started",
+                "memory_context",
+                "tool_registry",
+                "tool_use",
+                "tool_result",
+                "result",
+                "memory_saved",
+                "task_finished",
+            },
+            event_types,
+        )
+
+        tasks_resp = await self.client.get(f"/api/minds/{mind_id}/tasks")
+        self.assertEqual(tasks_resp.status_code, 200)
+        tasks = tasks_resp.json()
+        self.assertEqual(len(tasks), 1)
+        self.assertEqual(tasks[0]["status"], "completed")
+
+        task_id = tasks[0]["id"]
+        trace_resp = await self.client.get(
+            f"/api/minds/{mind_id}/tasks/{task_id}/trace"
+        )
+        self.assertEqual(trace_resp.status_code, 200)
+        trace = trace_resp.json()
+        self.assertEqual(trace["task_id"], task_id)
+        trace_types = {evt["type"] for evt in trace["events"]}
+        self.assertLessEqual({"task_started", "tool_use", "task_finished"}, trace_types)
+
+        memory_resp = await self.client.get(f"/api/minds/{mind_id}/memory")
+        self.assertEqual(memory_resp.status_code, 200)
+        memories = memory_resp.json()
+        self.assertTrue(any(m["category"] == "task_result" for m in memories))
+
+    @patch(_RUN_AGENT, new=_fake_drone_isolation_run)
+    async def test_spawn_agent_uses_isolated_workspace(self):
+        mind_id = self.fixture_mind_id
+
+        async with self.client.stream(
+            "POST",
+            f"/api/minds/{mind_id}/delegate",
+            json={
+                "description": "Run workspace isolation check",
+                "team": "default",
+            },
+        ) as response:
+            self.assertEqual(response.status_code, 200)
+            events = await self._read_sse(response)
+
+        text_events = [e.get("content") for e in events if e.get("type") == "text"]
+        self.assertTrue(
+            any("drone_workspace_leak=False" in str(content) for content in text_events)
+        )
+
+    @patch(_RUN_AGENT, new=_fake_final_text_run)
+    async def test_result_final_text_is_persisted_and_saved_to_memory(self):
+        create_resp = await self.client.post(
+            "/api/minds",
+            json={"name": "Signal"},
+        )
+        self.assertEqual(create_resp.status_code, 200)
+        mind_id = create_resp.json()["id"]
+
+        async with self.client.stream(
+            "POST",
+            f"/api/minds/{mind_id}/delegate",
+            json={"description": "Summarize launch plan", "team": "default"},
+        ) as response:
+            self.assertEqual(response.status_code, 200)
+            events = await self._read_sse(response)
+
+        event_types = {evt["type"] for evt in events}
+        self.assertLessEqual({"memory_context", "memory_saved"}, event_types)
+
+        tasks_resp = await self.client.get(f"/api/minds/{mind_id}/tasks")
+        tasks = tasks_resp.json()
+        self.assertEqual(len(tasks), 1)
+        self.assertEqual(tasks[0]["status"], "completed")
+        self.assertEqual(
+            tasks[0]["result"], "Completed summary from final result payload."
+        )
+
+        memory_resp = await self.client.get(f"/api/minds/{mind_id}/memory")
+        memories = memory_resp.json()
+        categories = {memory["category"] for memory in memories}
+        self.assertLessEqual({"task_result", "mind_insight"}, categories)
+
+        task_result_memory = next(
+            memory for memory in memories if memory["category"] == "task_result"
+        )
+        self.assertIn(
+            "Completed summary from final result payload.",
+            task_result_memory["content"],
+        )
+
+    @patch(_RUN_AGENT, new=_fake_error_result_run)
+    async def test_error_result_marks_task_failed(self):
+        create_resp = await self.client.post(
+            "/api/minds",
+            json={"name": "Signal"},
+        )
+        self.assertEqual(create_resp.status_code, 200)
+        mind_id = create_resp.json()["id"]
+
+        async with self.client.stream(
+            "POST",
+            f"/api/minds/{mind_id}/delegate",
+            json={"description": "Run failure check", "team": "default"},
+        ) as response:
+            self.assertEqual(response.status_code, 200)
+            events = await self._read_sse(response)
+
+        event_types = [evt["type"] for evt in events]
+        self.assertIn("error", event_types)
+
+        finished = next(evt for evt in events if evt["type"] == "task_finished")
+        self.assertEqual(finished["content"]["status"], "failed")
+
+        tasks_resp = await self.client.get(f"/api/minds/{mind_id}/tasks")
+        tasks = tasks_resp.json()
+        self.assertEqual(len(tasks), 1)
+        self.assertEqual(tasks[0]["status"], "failed")
+        self.assertIn("Upstream provider unavailable", tasks[0]["result"])
+
+    @patch(_RUN_AGENT, new=_fake_recovering_run)
+    async def test_intermediate_error_event_does_not_force_failure_when_result_completes(
+        self,
+    ):
+        create_resp = await self.client.post(
+            "/api/minds",
+            json={"name": "Signal"},
+        )
+        self.assertEqual(create_resp.status_code, 200)
+        mind_id = create_resp.json()["id"]
+
+        async with self.client.stream(
+            "POST",
+            f"/api/minds/{mind_id}/delegate",
+            json={"description": "Run recovery check", "team": "default"},
+        ) as response:
+            self.assertEqual(response.status_code, 200)
+            events = await self._read_sse(response)
+
+        event_types = [evt["type"] for evt in events]
+        self.assertIn("error", event_types)
+
+        finished = next(evt for evt in events if evt["type"] == "task_finished")
+        self.assertEqual(finished["content"]["status"], "completed")
+
+        tasks_resp = await self.client.get(f"/api/minds/{mind_id}/tasks")
+        tasks = tasks_resp.json()
+        self.assertEqual(len(tasks), 1)
+        self.assertEqual(tasks[0]["status"], "completed")
+        self.assertEqual(tasks[0]["result"], "Recovered and completed successfully.")
+
+    @patch(_RUN_AGENT, new=_fake_text_delta_volume_run)
+    async def test_text_delta_volume_does_not_trip_structural_event_limit(self):
+        create_resp = await self.client.post(
+            "/api/minds",
+            json={"name": "Signal"},
+        )
+        self.assertEqual(create_resp.status_code, 200)
+        mind_id = create_resp.json()["id"]
+
+        async with self.client.stream(
+            "POST",
+            f"/api/minds/{mind_id}/delegate",
+            json={"description": "How should you evolve next?", "team": "default"},
+        ) as response:
+            self.assertEqual(response.status_code, 200)
+            types, error_messages, finished = await self._scan_sse_types(response)
+
+        self.assertEqual(types["text_delta"], _TEXT_DELTA_VOLUME)
+        self.assertIsNotNone(finished)
+        self.assertEqual(finished["content"]["status"], "completed")
+        self.assertFalse(
+            any("Event limit reached" in message for message in error_messages),
+            msg=f"Unexpected structural event limit failure: {error_messages}",
+        )
+
+        tasks_resp = await self.client.get(f"/api/minds/{mind_id}/tasks")
+        tasks = tasks_resp.json()
+        self.assertEqual(len(tasks), 1)
+        self.assertEqual(tasks[0]["status"], "completed")
+        self.assertIn("charter editor", tasks[0]["result"])
+
+    @patch(_RUN_AGENT, side_effect=_fake_completed_run)
+    async def test_delegate_prompt_includes_recent_user_feedback_memory(
+        self, run_agent
+    ):
+        create_resp = await self.client.post(
             "/api/minds",
             json={"name": "Coach"},
         )
         self.assertEqual(create_resp.status_code, 200)
         mind_id = create_resp.json()["id"]
 
-        feedback_resp = self.client.post(
+        feedback_resp = await self.client.post(
             f"/api/minds/{mind_id}/feedback",
             json={
                 "content": "Prefer shipping a reversible draft over asking for confirmation.",
@@ -537,76 +635,51 @@ class MindApiTests(unittest.TestCase):
         )
         self.assertEqual(feedback_resp.status_code, 200)
 
-        captured_prompt: dict[str, str] = {}
+        async with self.client.stream(
+            "POST",
+            f"/api/minds/{mind_id}/delegate",
+            json={"description": "Plan next sprint priorities", "team": "default"},
+        ) as response:
+            self.assertEqual(response.status_code, 200)
+            _ = await self._read_sse(response)
 
-        async def fake_run_agent(*args, **kwargs):
-            captured_prompt["value"] = kwargs.get("system_prompt", "")
-            yield {
-                "type": "result",
-                "content": {
-                    "subtype": "completed",
-                    "final_text": "Applied feedback-aware recommendation.",
-                },
-            }
-
-        with patch("backend.mind.pipeline.run_agent", new=fake_run_agent):
-            with self.client.stream(
-                "POST",
-                f"/api/minds/{mind_id}/delegate",
-                json={"description": "Plan next sprint priorities", "team": "default"},
-            ) as response:
-                self.assertEqual(response.status_code, 200)
-                _ = self._read_sse(response)
-
-        system_prompt = captured_prompt.get("value", "")
+        system_prompt = run_agent.call_args.kwargs.get("system_prompt", "")
         self.assertIn("Prefer shipping a reversible draft", system_prompt)
         self.assertIn("user_feedback", system_prompt)
 
-    def test_quick_followup_does_not_infer_implicit_feedback(self):
-        create_resp = self.client.post(
+    @patch(_RUN_AGENT, side_effect=_fake_completed_run)
+    async def test_quick_followup_does_not_infer_implicit_feedback(self, run_agent):
+        create_resp = await self.client.post(
             "/api/minds",
             json={"name": "Scout"},
         )
         self.assertEqual(create_resp.status_code, 200)
         mind_id = create_resp.json()["id"]
 
-        captured_prompts: list[str] = []
+        async with self.client.stream(
+            "POST",
+            f"/api/minds/{mind_id}/delegate",
+            json={
+                "description": "Draft onboarding plan for backend engineers",
+                "team": "default",
+            },
+        ) as first_response:
+            self.assertEqual(first_response.status_code, 200)
+            _ = await self._read_sse(first_response)
 
-        async def fake_run_agent(*args, **kwargs):
-            captured_prompts.append(kwargs.get("system_prompt", ""))
-            yield {
-                "type": "result",
-                "content": {
-                    "subtype": "completed",
-                    "final_text": "Delivered concise plan draft.",
-                },
-            }
-
-        with patch("backend.mind.pipeline.run_agent", new=fake_run_agent):
-            with self.client.stream(
-                "POST",
-                f"/api/minds/{mind_id}/delegate",
-                json={
-                    "description": "Draft onboarding plan for backend engineers",
-                    "team": "default",
-                },
-            ) as first_response:
-                self.assertEqual(first_response.status_code, 200)
-                _ = self._read_sse(first_response)
-
-            with self.client.stream(
-                "POST",
-                f"/api/minds/{mind_id}/delegate",
-                json={
-                    "description": "Revise onboarding plan for backend engineers with clearer phases",
-                    "team": "default",
-                },
-            ) as second_response:
-                self.assertEqual(second_response.status_code, 200)
-                second_events = self._read_sse(second_response)
+        async with self.client.stream(
+            "POST",
+            f"/api/minds/{mind_id}/delegate",
+            json={
+                "description": "Revise onboarding plan for backend engineers with clearer phases",
+                "team": "default",
+            },
+        ) as second_response:
+            self.assertEqual(second_response.status_code, 200)
+            second_events = await self._read_sse(second_response)
 
-        self.assertGreaterEqual(len(captured_prompts), 2)
-        second_prompt = captured_prompts[-1]
+        self.assertGreaterEqual(run_agent.call_count, 2)
+        second_prompt = run_agent.call_args.kwargs.get("system_prompt", "")
         self.assertNotIn("quick follow-up on a similar task", second_prompt)
 
         memory_context_event = next(
@@ -615,15 +688,18 @@ class MindApiTests(unittest.TestCase):
         context_payload = memory_context_event["content"]
         self.assertEqual(context_payload.get("implicit_count", 0), 0)
 
-        implicit_resp = self.client.get(
+        implicit_resp = await self.client.get(
             f"/api/minds/{mind_id}/memory?category=implicit_feedback"
         )
         self.assertEqual(implicit_resp.status_code, 200)
         implicit_memories = implicit_resp.json()
         self.assertEqual(implicit_memories, [])
 
-    def test_delegate_prompt_includes_charter_and_runtime_manifest(self):
-        create_resp = self.client.post(
+    @patch(_RUN_AGENT, side_effect=_fake_completed_run)
+    async def test_delegate_prompt_includes_charter_and_runtime_manifest(
+        self, run_agent
+    ):
+        create_resp = await self.client.post(
             "/api/minds",
             json={
                 "name": "Builder",
@@ -635,28 +711,15 @@ class MindApiTests(unittest.TestCase):
         self.assertEqual(create_resp.status_code, 200)
         mind_id = create_resp.json()["id"]
 
-        captured_prompt: dict[str, str] = {}
+        async with self.client.stream(
+            "POST",
+            f"/api/minds/{mind_id}/delegate",
+            json={"description": "What capabilities should we add next?"},
+        ) as response:
+            self.assertEqual(response.status_code, 200)
+            _ = await self._read_sse(response)
 
-        async def fake_run_agent(*args, **kwargs):
-            captured_prompt["value"] = kwargs.get("system_prompt", "")
-            yield {
-                "type": "result",
-                "content": {
-                    "subtype": "completed",
-                    "final_text": "Capability self-assessment complete.",
-                },
-            }
-
-        with patch("backend.mind.pipeline.run_agent", new=fake_run_agent):
-            with self.client.stream(
-                "POST",
-                f"/api/minds/{mind_id}/delegate",
-                json={"description": "What capabilities should we add next?"},
-            ) as response:
-                self.assertEqual(response.status_code, 200)
-                _ = self._read_sse(response)
-
-        system_prompt = captured_prompt.get("value", "")
+        system_prompt = run_agent.call_args.kwargs.get("system_prompt", "")
         self.assertIn("Mind charter:", system_prompt)
         self.assertIn(
             "Continuously assess and improve Mind capabilities.",
@@ -672,30 +735,27 @@ class MindApiTests(unittest.TestCase):
 
 class MindStoreTests(unittest.TestCase):
     def test_list_tasks_orders_by_created_at_desc(self):
-        tmp_dir = Path(tempfile.mkdtemp(prefix="mind-store-tests-"))
-        store = MindStore(tmp_dir / "test.db")
-        try:
-            mind_id = "mind_1"
-            older = Task(
-                id="zzz_older",
-                mind_id=mind_id,
-                description="older task",
-                created_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
-            )
-            newer = Task(
-                id="aaa_newer",
-                mind_id=mind_id,
-                description="newer task",
-                created_at=datetime(2025, 1, 2, tzinfo=timezone.utc),
-            )
-
+        store = MindStore(":memory:")
+        mind_id = "mind_1"
+        older = Task(
+            id="zzz_older",
+            mind_id=mind_id,
+            description="older task",
+            created_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        )
+        newer = Task(
+            id="aaa_newer",
+            mind_id=mind_id,
+            description="newer task",
+            created_at=datetime(2025, 1, 2, tzinfo=timezone.utc),
+        )
+
+        with store.transaction():
             store.save_task(mind_id, older)
             store.save_task(mind_id, newer)
 
-            tasks = store.list_tasks(mind_id)
-            self.assertEqual([task.id for task in tasks], ["aaa_newer", "zzz_older"])
-        finally:
-            shutil.rmtree(tmp_dir, ignore_errors=True)
+        tasks = store.list_tasks(mind_id)
+        self.assertEqual([task.id for task in tasks], ["aaa_newer", "zzz_older"])
 
 
 class SpawnAgentToolTests(unittest.IsolatedAsyncioTestCase):
@@ -724,23 +784,27 @@ class SpawnAgentToolTests(unittest.IsolatedAsyncioTestCase):
 
 
 class MemoryToolTests(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.manager = MemoryManager(":memory:")
+
+    def setUp(self) -> None:
+        self.manager.clear()
+
     async def test_memory_save_limits_calls(self):
-        tmp_dir = Path(tempfile.mkdtemp(prefix="memory-tool-tests-"))
-        manager = MemoryManager(tmp_dir / "test.db")
-        try:
-            tools = create_memory_tools(manager, "mind_1", max_saves=1)
-            memory_save = next(tool for tool in tools if tool.name == "memory_save")
-
-            first = await memory_save.execute("mc_1", {"content": "first note"})
-            self.assertIn("Saved memory:", getattr(first.content[0], "text", ""))
-
-            second = await memory_save.execute("mc_2", {"content": "second note"})
-            self.assertIn(
-                "call limit reached",
-                getattr(second.content[0], "text", ""),
-            )
-
-            memories = manager.list_all("mind_1")
-            self.assertEqual(len(memories), 1)
-        finally:
-            shutil.rmtree(tmp_dir, ignore_errors=True)
+        manager = self.manager
+        # Tools carry per-run call counters, so each test builds its own.
+        tools = create_memory_tools(manager, "mind_1", max_saves=1)
+        memory_save = next(tool for tool in tools if tool.name == "memory_save")
+
+        first = await memory_save.execute("mc_1", {"content": "first note"})
+        self.assertIn("Saved memory:", getattr(first.content[0], "text", ""))
+
+        second = await memory_save.execute("mc_2", {"content": "second note"})
+        self.assertIn(
+            "call limit reached",
+            getattr(second.content[0], "text", ""),
+        )
+
+        memories = manager.list_all("mind_1")
+        self.assertEqual(len(memories), 1)
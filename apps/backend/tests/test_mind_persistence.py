@@ -1,13 +1,11 @@
-import shutil
+import asyncio
 import sqlite3
-import sys
 import tempfile
 import threading
 import unittest
+import uuid
 from pathlib import Path
 
-sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
-
 from backend.mind.database import init_db
 from backend.mind.memory import MemoryManager
 from backend.mind.schema import MemoryEntry, MindCharter, MindProfile, Task
@@ -15,276 +13,396 @@ from backend.mind.store import MindStore
 
 
 class DatabaseInitTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        # On-disk only for WAL and migration checks; removed once per class.
+        tmp_root = tempfile.TemporaryDirectory(prefix="db-init-tests-")
+        cls.addClassCleanup(tmp_root.cleanup)
+        cls._tmp_root = Path(tmp_root.name)
+
+    def _make_tmp_dir(self) -> Path:
+        return Path(tempfile.mkdtemp(dir=self._tmp_root))
+
     def test_init_db_creates_tables_and_enables_wal(self):
-        tmp_dir = Path(tempfile.mkdtemp(prefix="db-init-tests-"))
-        try:
-            db_path = tmp_dir / "test.db"
-            conn = init_db(db_path)
+        tmp_dir = self._make_tmp_dir()
+        db_path = tmp_dir / "test.db"
+        conn = init_db(db_path)
+
+        mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        self.assertEqual(mode, "wal")
+
+        tables = {
+            row[0]
+            for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type='table'"
+            ).fetchall()
+        }
+        self.assertIn("minds", tables)
+        self.assertIn("tasks", tables)
+        self.assertIn("task_traces", tables)
+        self.assertIn("memories", tables)
+
+        conn.close()
 
+    def test_init_db_is_idempotent(self):
+        tmp_dir = self._make_tmp_dir()
+        db_path = tmp_dir / "test.db"
+        conn1 = init_db(db_path)
+        conn1.close()
+        conn2 = init_db(db_path)
+        conn2.close()
+
+    def test_init_db_accepts_shared_memory_uri(self):
+        uri = f"file:db-init-{uuid.uuid4().hex}?mode=memory&cache=shared"
+        conn = init_db(uri)
+        other = init_db(uri)
+        try:
             mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
-            self.assertEqual(mode, "wal")
+            self.assertEqual(mode, "memory")
+
+            # A second connection on the URI sees the same database.
+            other.execute(
+                "INSERT INTO minds (id, name, created_at) VALUES (?, ?, ?)",
+                ("mind_1", "InMemory", "2025-01-01T00:00:00+00:00"),
+            )
+            other.commit()
+            row = conn.execute("SELECT name FROM minds WHERE id = 'mind_1'").fetchone()
+            self.assertEqual(row["name"], "InMemory")
+        finally:
+            other.close()
+            conn.close()
 
+    def test_init_db_accepts_private_memory_path(self):
+        conn = init_db(":memory:")
+        try:
+            mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+            self.assertEqual(mode, "memory")
             tables = {
                 row[0]
                 for row in conn.execute(
                     "SELECT name FROM sqlite_master WHERE type='table'"
                 ).fetchall()
             }
-            self.assertIn("minds", tables)
-            self.assertIn("tasks", tables)
-            self.assertIn("task_traces", tables)
             self.assertIn("memories", tables)
-
-            conn.close()
         finally:
-            shutil.rmtree(tmp_dir, ignore_errors=True)
-
-    def test_init_db_is_idempotent(self):
-        tmp_dir = Path(tempfile.mkdtemp(prefix="db-idempotent-tests-"))
-        try:
-            db_path = tmp_dir / "test.db"
-            conn1 = init_db(db_path)
-            conn1.close()
-            conn2 = init_db(db_path)
-            conn2.close()
-        finally:
-            shutil.rmtree(tmp_dir, ignore_errors=True)
-
-    def test_init_db_migrates_existing_minds_table_with_charter_column(self):
-        tmp_dir = Path(tempfile.mkdtemp(prefix="db-migrate-charter-tests-"))
-        try:
-            db_path = tmp_dir / "test.db"
-
-            conn = sqlite3.connect(str(db_path))
-            conn.executescript(
-                """
-                CREATE TABLE minds (
-                    id TEXT PRIMARY KEY,
-                    name TEXT NOT NULL,
-                    personality TEXT NOT NULL DEFAULT '',
-                    preferences TEXT NOT NULL DEFAULT '{}',
-                    system_prompt TEXT NOT NULL DEFAULT '',
-                    created_at TEXT NOT NULL
-                );
-                """
-            )
-            conn.commit()
             conn.close()
 
-            migrated = init_db(db_path)
-            columns = {
-                row[1]
-                for row in migrated.execute("PRAGMA table_info(minds)").fetchall()
-            }
-            self.assertIn("charter", columns)
-            migrated.close()
-        finally:
-            shutil.rmtree(tmp_dir, ignore_errors=True)
+    def test_init_db_migrates_existing_minds_table_with_charter_column(self):
+        tmp_dir = self._make_tmp_dir()
+        db_path = tmp_dir / "test.db"
+
+        conn = sqlite3.connect(str(db_path))
+        conn.executescript(
+            """
+            CREATE TABLE minds (
+                id TEXT PRIMARY KEY,
+                name TEXT NOT NULL,
+                personality TEXT NOT NULL DEFAULT '',
+                preferences TEXT NOT NULL DEFAULT '{}',
+                system_prompt TEXT NOT NULL DEFAULT '',
+                created_at TEXT NOT NULL
+            );
+            """
+        )
+        conn.commit()
+        conn.close()
+
+        migrated = init_db(db_path)
+        columns = {
+            row[1] for row in migrated.execute("PRAGMA table_info(minds)").fetchall()
+        }
+        self.assertIn("charter", columns)
+        migrated.close()
 
 
 class MindStoreSqliteTests(unittest.TestCase):
     def test_mind_crud(self):
-        tmp_dir = Path(tempfile.mkdtemp(prefix="mind-store-tests-"))
-        try:
-            store = MindStore(tmp_dir / "test.db")
+        store = MindStore(":memory:")
 
-            mind = MindProfile(name="TestMind", personality="friendly")
-            store.save_mind(mind)
+        mind = MindProfile(name="TestMind", personality="friendly")
+        store.save_mind(mind)
 
-            loaded = store.load_mind(mind.id)
-            self.assertIsNotNone(loaded)
-            if loaded is None:
-                self.fail("Expected stored mind to be loadable")
-            self.assertEqual(loaded.name, "TestMind")
-            self.assertEqual(loaded.personality, "friendly")
+        loaded = store.load_mind(mind.id)
+        self.assertIsNotNone(loaded)
+        if loaded is None:
+            self.fail("Expected stored mind to be loadable")
+        self.assertEqual(loaded.name, "TestMind")
+        self.assertEqual(loaded.personality, "friendly")
 
-            minds = store.list_minds()
-            self.assertEqual(len(minds), 1)
+        minds = store.list_minds()
+        self.assertEqual(len(minds), 1)
 
-            deleted = store.delete_mind(mind.id)
-            self.assertTrue(deleted)
-            self.assertIsNone(store.load_mind(mind.id))
-        finally:
-            shutil.rmtree(tmp_dir, ignore_errors=True)
+        deleted = store.delete_mind(mind.id)
+        self.assertTrue(deleted)
+        self.assertIsNone(store.load_mind(mind.id))
 
     def test_task_trace_roundtrip(self):
-        tmp_dir = Path(tempfile.mkdtemp(prefix="mind-trace-tests-"))
-        try:
-            store = MindStore(tmp_dir / "test.db")
-            mind_id = "mind_1"
-            task_id = "task_1"
-
-            events = [{"type": "text", "content": "hello"}]
-            store.save_task_trace(mind_id, task_id, events)
-
-            trace = store.load_task_trace(mind_id, task_id)
-            self.assertIsNotNone(trace)
-            if trace is None:
-                self.fail("Expected task trace to roundtrip")
-            self.assertEqual(trace["task_id"], task_id)
-            self.assertEqual(trace["events"], events)
-        finally:
-            shutil.rmtree(tmp_dir, ignore_errors=True)
+        store = MindStore(":memory:")
+        mind_id = "mind_1"
+        task_id = "task_1"
 
-    def test_mind_charter_roundtrip(self):
-        tmp_dir = Path(tempfile.mkdtemp(prefix="mind-charter-tests-"))
-        try:
-            store = MindStore(tmp_dir / "test.db")
-            mind = MindProfile(
-                name="Builder",
-                charter=MindCharter(
-                    mission="Assess and evolve the Mind runtime.",
-                    non_goals=["Faking unsupported capabilities."],
-                ),
-            )
+        events = [{"type": "text", "content": "hello"}]
+        store.save_task_trace(mind_id, task_id, events)
 
-            store.save_mind(mind)
-            loaded = store.load_mind(mind.id)
+        trace = store.load_task_trace(mind_id, task_id)
+        self.assertIsNotNone(trace)
+        if trace is None:
+            self.fail("Expected task trace to roundtrip")
+        self.assertEqual(trace["task_id"], task_id)
+        self.assertEqual(trace["events"], events)
 
-            self.assertIsNotNone(loaded)
-            if loaded is None:
-                self.fail("Expected stored mind with charter to be loadable")
-            self.assertEqual(
-                loaded.charter.mission,
-                "Assess and evolve the Mind runtime.",
-            )
-            self.assertIn(
-                "Faking unsupported capabilities.",
-                loaded.charter.non_goals,
-            )
-        finally:
-            shutil.rmtree(tmp_dir, ignore_errors=True)
+    def test_mind_charter_roundtrip(self):
+        store = MindStore(":memory:")
+        mind = MindProfile(
+            name="Builder",
+            charter=MindCharter(
+                mission="Assess and evolve the Mind runtime.",
+                non_goals=["Faking unsupported capabilities."],
+            ),
+        )
+
+        store.save_mind(mind)
+        loaded = store.load_mind(mind.id)
+
+        self.assertIsNotNone(loaded)
+        if loaded is None:
+            self.fail("Expected stored mind with charter to be loadable")
+        self.assertEqual(
+            loaded.charter.mission,
+            "Assess and evolve the Mind runtime.",
+        )
+        self.assertIn(
+            "Faking unsupported capabilities.",
+            loaded.charter.non_goals,
+        )
+
+    def test_save_task_updates_existing_row(self):
+        store = MindStore(":memory:")
+        task = Task(mind_id="mind_1", description="draft")
+        store.save_task("mind_1", task)
+
+        task.status = "completed"
+        task.result = "done"
+        store.save_task("mind_1", task)
+
+        tasks = store.list_tasks("mind_1")
+        self.assertEqual(len(tasks), 1)
+        self.assertEqual(tasks[0].status, "completed")
+        self.assertEqual(tasks[0].result, "done")
 
     def test_concurrent_writes(self):
-        tmp_dir = Path(tempfile.mkdtemp(prefix="mind-concurrent-tests-"))
-        try:
-            store = MindStore(tmp_dir / "test.db")
-            mind_id = "mind_1"
-            errors = []
-
-            def worker(start: int) -> None:
-                try:
-                    for i in range(50):
-                        task = Task(
-                            id=f"task_{start}_{i}",
-                            mind_id=mind_id,
-                            description=f"task {start}_{i}",
-                        )
-                        store.save_task(mind_id, task)
-                except Exception as exc:
-                    errors.append(exc)
-
-            threads = [threading.Thread(target=worker, args=(t,)) for t in range(4)]
-            for thread in threads:
-                thread.start()
-            for thread in threads:
-                thread.join()
-
-            self.assertEqual(errors, [])
-            tasks = store.list_tasks(mind_id)
-            self.assertEqual(len(tasks), 200)
-        finally:
-            shutil.rmtree(tmp_dir, ignore_errors=True)
+        store = MindStore(":memory:")
+        mind_id = "mind_1"
+        errors = []
+
+        def worker(start: int) -> None:
+            try:
+                for i in range(50):
+                    # Literal, trusted inputs: skip validation, keep defaults.
+                    task = Task.model_construct(
+                        id=f"task_{start}_{i}",
+                        mind_id=mind_id,
+                        description=f"task {start}_{i}",
+                    )
+                    store.save_task(mind_id, task)
+            except Exception as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=worker, args=(t,)) for t in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        tasks = store.list_tasks(mind_id)
+        self.assertEqual(len(tasks), 200)
+
+    def test_save_tasks_inserts_and_updates_batch(self):
+        store = MindStore(":memory:")
+        mind_id = "mind_1"
+        tasks = [Task(mind_id=mind_id, description=f"task {i}") for i in range(3)]
+
+        ids = store.save_tasks(mind_id, tasks)
+        self.assertEqual(ids, [task.id for task in tasks])
+
+        tasks[0].status = "completed"
+        store.save_tasks(mind_id, iter(tasks[:1]))
+
+        saved = {task.id: task for task in store.list_tasks(mind_id)}
+        self.assertEqual(set(saved), set(ids))
+        self.assertEqual(saved[tasks[0].id].status, "completed")
+
+    def test_transaction_rolls_back_all_writes_on_error(self):
+        store = MindStore(":memory:")
+        mind_id = "mind_1"
+
+        with self.assertRaises(RuntimeError):
+            with store.transaction():
+                store.save_task(mind_id, Task(mind_id=mind_id, description="a"))
+                store.save_task(mind_id, Task(mind_id=mind_id, description="b"))
+                raise RuntimeError("abort batch")
+
+        self.assertEqual(store.list_tasks(mind_id), [])
+
+        with store.transaction():
+            store.save_task(mind_id, Task(mind_id=mind_id, description="c"))
+        self.assertEqual(len(store.list_tasks(mind_id)), 1)
+
+    def test_nested_transaction_rolls_back_with_outer_block(self):
+        store = MindStore(":memory:")
+        mind_id = "mind_1"
+
+        with self.assertRaises(RuntimeError):
+            with store.transaction():
+                with store.transaction():
+                    store.save_task(mind_id, Task(mind_id=mind_id, description="inner"))
+                store.save_task(mind_id, Task(mind_id=mind_id, description="outer"))
+                raise RuntimeError("abort batch")
+
+        self.assertEqual(store.list_tasks(mind_id), [])
+
+    def test_nested_transaction_error_discards_only_inner_writes(self):
+        store = MindStore(":memory:")
+        mind_id = "mind_1"
+
+        with store.transaction():
+            store.save_task(mind_id, Task(mind_id=mind_id, description="outer"))
+            with self.assertRaises(RuntimeError):
+                with store.transaction():
+                    store.save_task(mind_id, Task(mind_id=mind_id, description="inner"))
+                    store.clear()
+                    raise RuntimeError("abort inner")
+
+        tasks = store.list_tasks(mind_id)
+        self.assertEqual([task.description for task in tasks], ["outer"])
+
+    def test_transaction_rejects_store_use_from_another_task(self):
+        store = MindStore(":memory:")
+        mind_id = "mind_1"
+
+        async def scenario() -> None:
+            entered = asyncio.Event()
+            release = asyncio.Event()
+
+            async def batch() -> None:
+                with store.transaction():
+                    store.save_task(mind_id, Task(mind_id=mind_id, description="a"))
+                    entered.set()
+                    await release.wait()
+                    raise RuntimeError("abort batch")
+
+            batch_task = asyncio.create_task(batch())
+            await entered.wait()
+            with self.assertRaises(RuntimeError):
+                store.save_task(mind_id, Task(mind_id=mind_id, description="b"))
+            release.set()
+            with self.assertRaises(RuntimeError):
+                await batch_task
+
+        asyncio.run(scenario())
+
+        # The rejected write can be retried once the transaction is over.
+        store.save_task(mind_id, Task(mind_id=mind_id, description="b"))
+        tasks = store.list_tasks(mind_id)
+        self.assertEqual([task.description for task in tasks], ["b"])
+
+    def test_clear_removes_minds_tasks_and_traces(self):
+        store = MindStore(":memory:")
+        mind = MindProfile(name="Ephemeral")
+        store.save_mind(mind)
+        store.save_task(mind.id, Task(mind_id=mind.id, description="t"))
+        store.save_task_trace(mind.id, "task_1", [{"type": "text"}])
+
+        store.clear()
+
+        self.assertEqual(store.list_minds(), [])
+        self.assertEqual(store.list_tasks(mind.id), [])
+        self.assertIsNone(store.load_task_trace(mind.id, "task_1"))
 
 
 class MemoryFtsTests(unittest.TestCase):
     def test_fts_search_finds_matching_memories(self):
-        tmp_dir = Path(tempfile.mkdtemp(prefix="memory-fts-tests-"))
-        try:
-            manager = MemoryManager(tmp_dir / "test.db")
-            mind_id = "mind_1"
+        manager = MemoryManager(":memory:")
+        mind_id = "mind_1"
 
-            manager.save(
+        manager.save_many(
+            [
                 MemoryEntry(
                     mind_id=mind_id,
                     content="Release notes for version 3.2",
                     category="notes",
                     relevance_keywords=["release", "version"],
-                )
-            )
-            manager.save(
+                ),
                 MemoryEntry(
                     mind_id=mind_id,
                     content="Meeting notes from Monday standup",
                     category="notes",
                     relevance_keywords=["meeting", "standup"],
-                )
-            )
-            manager.save(
+                ),
                 MemoryEntry(
                     mind_id=mind_id,
                     content="Database migration plan for Q4",
                     category="planning",
                     relevance_keywords=["database", "migration"],
-                )
-            )
-
-            results = manager.search(mind_id, "release notes")
-            self.assertTrue(len(results) >= 1)
-            self.assertTrue(any("release" in r.content.lower() for r in results))
+                ),
+            ]
+        )
 
-            results = manager.search(mind_id, "standup meeting")
-            self.assertTrue(len(results) >= 1)
-            self.assertTrue(any("standup" in r.content.lower() for r in results))
+        results = manager.search(mind_id, "release notes")
+        self.assertTrue(len(results) >= 1)
+        self.assertTrue(any("release" in r.content.lower() for r in results))
 
-        finally:
-            shutil.rmtree(tmp_dir, ignore_errors=True)
+        results = manager.search(mind_id, "standup meeting")
+        self.assertTrue(len(results) >= 1)
+        self.assertTrue(any("standup" in r.content.lower() for r in results))
 
     def test_search_empty_query_returns_empty(self):
-        tmp_dir = Path(tempfile.mkdtemp(prefix="memory-empty-tests-"))
-        try:
-            manager = MemoryManager(tmp_dir / "test.db")
-            results = manager.search("mind_1", "")
-            self.assertEqual(results, [])
-        finally:
-            shutil.rmtree(tmp_dir, ignore_errors=True)
+        manager = MemoryManager(":memory:")
+        results = manager.search("mind_1", "")
+        self.assertEqual(results, [])
 
     def test_search_isolates_by_mind_id(self):
-        tmp_dir = Path(tempfile.mkdtemp(prefix="memory-isolation-tests-"))
-        try:
-            manager = MemoryManager(tmp_dir / "test.db")
+        manager = MemoryManager(":memory:")
 
-            manager.save(
-                MemoryEntry(
-                    mind_id="mind_a",
-                    content="Secret project alpha details",
-                )
-            )
-            manager.save(
-                MemoryEntry(
-                    mind_id="mind_b",
-                    content="Secret project beta details",
-                )
-            )
+        manager.save_many(
+            [
+                MemoryEntry(mind_id="mind_a", content="Secret project alpha details"),
+                MemoryEntry(mind_id="mind_b", content="Secret project beta details"),
+            ]
+        )
 
-            results_a = manager.search("mind_a", "secret project")
-            results_b = manager.search("mind_b", "secret project")
+        results_a = manager.search("mind_a", "secret project")
+        results_b = manager.search("mind_b", "secret project")
 
-            self.assertEqual(len(results_a), 1)
-            self.assertIn("alpha", results_a[0].content)
-            self.assertEqual(len(results_b), 1)
-            self.assertIn("beta", results_b[0].content)
-        finally:
-            shutil.rmtree(tmp_dir, ignore_errors=True)
+        self.assertEqual(len(results_a), 1)
+        self.assertIn("alpha", results_a[0].content)
+        self.assertEqual(len(results_b), 1)
+        self.assertIn("beta", results_b[0].content)
 
     def test_delete_removes_from_fts_index(self):
-        tmp_dir = Path(tempfile.mkdtemp(prefix="memory-delete-tests-"))
-        try:
-            manager = MemoryManager(tmp_dir / "test.db")
-            mind_id = "mind_1"
+        manager = MemoryManager(":memory:")
+        mind_id = "mind_1"
 
-            entry = MemoryEntry(mind_id=mind_id, content="Unique searchable content")
-            manager.save(entry)
+        entry = MemoryEntry(mind_id=mind_id, content="Unique searchable content")
+        manager.save(entry)
 
-            results = manager.search(mind_id, "unique searchable")
-            self.assertEqual(len(results), 1)
+        results = manager.search(mind_id, "unique searchable")
+        self.assertEqual(len(results), 1)
 
-            manager.delete(mind_id, entry.id)
+        manager.delete(mind_id, entry.id)
 
-            results = manager.search(mind_id, "unique searchable")
-            self.assertEqual(len(results), 0)
-        finally:
-            shutil.rmtree(tmp_dir, ignore_errors=True)
+        results = manager.search(mind_id, "unique searchable")
+        self.assertEqual(len(results), 0)
+
+    def test_clear_removes_memories_from_fts_index(self):
+        manager = MemoryManager(":memory:")
+        manager.save(MemoryEntry(mind_id="mind_1", content="Transient note"))
+
+        manager.clear()
+
+        self.assertEqual(manager.list_all("mind_1"), [])
+        self.assertEqual(manager.search("mind_1", "transient"), [])
 
 
 if __name__ == "__main__":